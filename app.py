@@ -2,10 +2,48 @@ import streamlit as st
 import requests
 import pandas as pd
 import json
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import io
+import hashlib
+import hmac
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from charts import (
+    render_project_health_gauge,
+    create_risk_breakdown_chart,
+    create_risk_heatmap,
+    create_risk_trend_chart,
+    create_timeline_chart,
+    create_portfolio_health_chart,
+    create_portfolio_severity_chart,
+    create_portfolio_factor_chart,
+    SEVERITY_LEVELS,
+)
+from risk_data import get_sample_data, get_project_risk_data, risk_data_fingerprint
+
+# Optional faster decoders, used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # Set page configuration
 st.set_page_config(
@@ -18,6 +56,46 @@ st.set_page_config(
 # Define the base URL for the API
 BASE_URL = "https://agentverse-uz89.onrender.com"
 
+# Seconds between chat history polls when the backend has no event stream;
+# doubled while the history is unchanged, up to the maximum
+CHAT_POLL_INTERVAL = 5
+CHAT_POLL_MAX_INTERVAL = 60
+# Seconds between refreshes of the chat area
+CHAT_REFRESH_INTERVAL = 2
+# Seconds to wait for data on the event stream before reconnecting
+CHAT_STREAM_TIMEOUT = 30
+# Seconds before retrying an event stream that failed to connect;
+# doubled on each failure, up to the maximum
+CHAT_STREAM_RETRY_INTERVAL = 5
+CHAT_STREAM_RETRY_MAX_INTERVAL = 300
+
+# Byte budgets for cached histories, project lists and figures
+GLOBAL_CACHE_BUDGET = 512 * 1024 * 1024
+SESSION_CACHE_BUDGET = 64 * 1024 * 1024
+# Latest chat entries kept for the open project when its full history cannot be cached
+CHAT_TAIL_ENTRIES = 200
+# Seconds before a cached project list is refetched
+PROJECTS_CACHE_TTL = 60
+# Number of projects whose risk data is fetched at the same time
+PORTFOLIO_FETCH_WORKERS = 8
+# Seconds before a project's risk data is refetched for the portfolio
+RISK_DATA_CACHE_TTL = 60
+
+# Responses larger than this are stream-parsed instead of read into memory
+STREAM_PARSE_THRESHOLD = 1024 * 1024
+
+# Function to get the HTTP session shared across reruns and browser sessions,
+# so connections and negotiated headers are reused
+@st.cache_resource
+def get_api_session():
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = "gzip, deflate, br" if brotli else "gzip, deflate"
+    session.headers["Accept"] = (
+        "application/msgpack, application/json;q=0.9, text/plain;q=0.8"
+        if msgpack else "application/json, text/plain;q=0.8"
+    )
+    return session
+
 # Define session state variables
 if 'current_page' not in st.session_state:
     st.session_state.current_page = 'landing'
@@ -31,6 +109,10 @@ if 'active_project_id' not in st.session_state:
     st.session_state.active_project_id = None
 if 'clear_chat_input' not in st.session_state:
     st.session_state.clear_chat_input = False
+if 'chat_listeners' not in st.session_state:
+    st.session_state.chat_listeners = {}
+if 'chat_tail' not in st.session_state:
+    st.session_state.chat_tail = None
 
 # CSS for styling
 st.markdown("""
@@ -111,28 +193,185 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Function to estimate the memory held by a cached value
+def estimate_size(obj, seen=None):
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, go.Figure):
+        return estimate_size(obj.to_plotly_json(), seen)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in obj)
+    return size
+
+# Function to get the id of the current browser session
+def current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else "default"
+
+# Function to check whether a browser session is still connected
+def session_is_active(session_id):
+    if not runtime.exists():
+        return True
+    return runtime.get_instance().is_active_session(session_id)
+
+# Process-wide LRU cache for per-session data with global and per-session
+# byte budgets. Entries are keyed by (session_id, namespace, key).
+class SessionCache:
+    def __init__(self, global_budget, session_budget):
+        self.global_budget = global_budget
+        self.session_budget = session_budget
+        self.entries = OrderedDict()
+        self.session_bytes = {}
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, session_id, namespace, key):
+        cache_key = (session_id, namespace, key)
+        with self.lock:
+            item = self.entries.get(cache_key)
+            if item is None:
+                return None
+            self.entries.move_to_end(cache_key)
+            return item[0]
+
+    def put(self, session_id, namespace, key, value):
+        cache_key = (session_id, namespace, key)
+        size = estimate_size(value)
+        with self.lock:
+            self._remove(cache_key)
+            # Values larger than a whole session budget are never cached
+            if size > self.session_budget:
+                return value
+            self.entries[cache_key] = (value, size)
+            self.session_bytes[session_id] = self.session_bytes.get(session_id, 0) + size
+            self.total_bytes += size
+            self._evict(session_id)
+        return value
+
+    def invalidate(self, session_id, namespace, key=None):
+        with self.lock:
+            for cache_key in list(self.entries):
+                if cache_key[:2] == (session_id, namespace) and key in (None, cache_key[2]):
+                    self._remove(cache_key)
+
+    def drop_session(self, session_id):
+        with self.lock:
+            for cache_key in list(self.entries):
+                if cache_key[0] == session_id:
+                    self._remove(cache_key)
+
+    def cleanup(self):
+        with self.lock:
+            session_ids = list(self.session_bytes)
+        for session_id in session_ids:
+            if not session_is_active(session_id):
+                self.drop_session(session_id)
+
+    def usage(self):
+        with self.lock:
+            rows = {}
+            for (session_id, namespace, _), (_, size) in self.entries.items():
+                row = rows.setdefault(session_id, {"session_id": session_id, "entries": 0, "bytes": 0})
+                row["entries"] += 1
+                row["bytes"] += size
+                row[namespace] = row.get(namespace, 0) + size
+            return self.total_bytes, list(rows.values())
+
+    def _remove(self, cache_key):
+        item = self.entries.pop(cache_key, None)
+        if item is None:
+            return
+        session_id = cache_key[0]
+        self.total_bytes -= item[1]
+        self.session_bytes[session_id] -= item[1]
+        if not self.session_bytes[session_id]:
+            del self.session_bytes[session_id]
+
+    def _evict(self, session_id):
+        # Least recently used entries of this session go first, then globally
+        if self.session_bytes.get(session_id, 0) > self.session_budget:
+            for cache_key in list(self.entries):
+                if cache_key[0] == session_id:
+                    self._remove(cache_key)
+                    if self.session_bytes.get(session_id, 0) <= self.session_budget:
+                        break
+        while self.total_bytes > self.global_budget and self.entries:
+            self._remove(next(iter(self.entries)))
+
+# Function to get the cache shared by all sessions of this process
+@st.cache_resource
+def get_session_cache():
+    return SessionCache(GLOBAL_CACHE_BUDGET, SESSION_CACHE_BUDGET)
+
+# Function to read a value cached for the current session
+def cache_get(namespace, key):
+    return get_session_cache().get(current_session_id(), namespace, key)
+
+# Function to cache a value for the current session
+def cache_put(namespace, key, value):
+    return get_session_cache().put(current_session_id(), namespace, key, value)
+
+# Function to decode an API response body
+def decode_response(response):
+    content_type = response.headers.get('content-type', '').split(';')[0].strip()
+    if msgpack and content_type in ('application/msgpack', 'application/x-msgpack'):
+        return msgpack.unpackb(response.content, raw=False)
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Function to decode a large JSON array without materializing the raw text
+def stream_json_array(response):
+    content_type = response.headers.get('content-type', '').split(';')[0].strip()
+    content_length = response.headers.get('content-length')
+    # Chunked responses have no length and may be the largest, so stream those too
+    is_large = content_length is None or int(content_length) > STREAM_PARSE_THRESHOLD
+    if ijson and content_type == 'application/json' and is_large:
+        response.raw.decode_content = True
+        return list(ijson.items(response.raw, 'item', use_float=True))
+    return decode_response(response)
+
 # Function to fetch all projects
 def get_projects():
     try:
-        response = requests.get(f"{BASE_URL}/projects/")
+        response = get_api_session().get(f"{BASE_URL}/projects/")
         if response.status_code == 200:
-            return response.json()
+            return decode_response(response)
         else:
             st.error(f"Error fetching projects: {response.status_code}")
-            return []
+            return None
     except Exception as e:
         st.error(f"Error connecting to API: {e}")
+        return None
+
+# Function to get the project list, reusing a recent copy for this session
+def get_cached_projects():
+    cached = cache_get("projects", "all")
+    if cached and time.time() - cached["fetched_at"] < PROJECTS_CACHE_TTL:
+        return cached["projects"]
+    projects = get_projects()
+    # Errors are not cached, so the next rerun tries the API again
+    if projects is None:
         return []
+    cache_put("projects", "all", {"fetched_at": time.time(), "projects": projects})
+    return projects
 
 # Function to create a new project
 def create_project(name):
     try:
-        response = requests.post(
+        response = get_api_session().post(
             f"{BASE_URL}/projects/",
             json={"name": name}
         )
         if response.status_code == 200:
-            return response.json()
+            get_session_cache().invalidate(current_session_id(), "projects")
+            return decode_response(response)
         else:
             st.error(f"Error creating project: {response.status_code}")
             return None
@@ -148,7 +387,7 @@ def init_chat(project_id, employee_file, project_file, financial_file):
             'project_file': project_file,
             'financial_file': financial_file
         }
-        response = requests.post(
+        response = get_api_session().post(
             f"{BASE_URL}/chat/init/{project_id}",
             files=files
         )
@@ -164,20 +403,20 @@ def init_chat(project_id, employee_file, project_file, financial_file):
 # Function to continue chat
 def continue_chat(project_id, text):
     try:
-        response = requests.post(
+        response = get_api_session().post(
             f"{BASE_URL}/chat/continue/{project_id}",
             json={"text": text}
         )
         
         # Check if response is plain text (not JSON)
-        if response.headers.get('content-type') == 'text/plain':
+        if response.headers.get('content-type', '').startswith('text/plain'):
             return response.text
         
-        # For JSON responses
+        # For JSON or msgpack responses
         if response.status_code == 200:
             try:
-                return response.json()
-            except:
+                return decode_response(response)
+            except ValueError:
                 return response.text
         else:
             st.error(f"Error sending message: {response.status_code}")
@@ -192,15 +431,212 @@ def continue_chat(project_id, text):
 # Function to get chat history
 def get_chat_history(project_id):
     try:
-        response = requests.get(f"{BASE_URL}/chats/{project_id}")
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Error fetching chat history: {response.status_code}")
-            return []
+        with get_api_session().get(f"{BASE_URL}/chats/{project_id}", stream=True) as response:
+            if response.status_code == 200:
+                return stream_json_array(response)
+            else:
+                st.error(f"Error fetching chat history: {response.status_code}")
+                return None
     except Exception as e:
         st.error(f"Error connecting to API: {e}")
-        return []
+        return None
+
+# Background listener that collects new chat entries for an open project.
+# It reads the backend's server-sent event stream and polls the chat history
+# while the stream is unavailable. The thread never touches st.* directly;
+# the chat fragment drains its entries into session state.
+class ChatListener(threading.Thread):
+    def __init__(self, project_id, session_id, http_session, known_count=0, catch_up=False):
+        super().__init__(daemon=True)
+        self.project_id = project_id
+        self.session_id = session_id
+        self.http_session = http_session
+        self.known_count = known_count
+        self.catch_up = catch_up
+        self.etag = None
+        self.last_event_id = None
+        self.pending = []
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+    def run(self):
+        # Pick up anything posted while the project was closed
+        if self.catch_up:
+            self.poll_history()
+        use_events = True
+        stream_retry_interval = CHAT_STREAM_RETRY_INTERVAL
+        next_stream_attempt = 0
+        poll_interval = CHAT_POLL_INTERVAL
+        # Exit once the browser session that opened the project disconnects
+        while not self.stop_event.is_set() and session_is_active(self.session_id):
+            if use_events and time.monotonic() >= next_stream_attempt:
+                try:
+                    # Only a missing endpoint turns the stream off for good
+                    use_events = self.listen_events()
+                    stream_retry_interval = CHAT_STREAM_RETRY_INTERVAL
+                    if use_events:
+                        # Catch entries posted while the stream was down; usually a cheap 304
+                        self.poll_history()
+                        # Short pause so a dropped stream does not reconnect in a tight loop
+                        self.stop_event.wait(1)
+                        continue
+                except (requests.RequestException, ValueError):
+                    next_stream_attempt = time.monotonic() + stream_retry_interval
+                    stream_retry_interval = min(stream_retry_interval * 2, CHAT_STREAM_RETRY_MAX_INTERVAL)
+            if self.poll_history():
+                poll_interval = CHAT_POLL_INTERVAL
+            else:
+                poll_interval = min(poll_interval * 2, CHAT_POLL_MAX_INTERVAL)
+            self.stop_event.wait(poll_interval)
+
+    def listen_events(self):
+        headers = {"Accept": "text/event-stream"}
+        # Ask the backend to replay events missed since the last one received
+        if self.last_event_id:
+            headers["Last-Event-ID"] = self.last_event_id
+        with requests.get(
+            f"{BASE_URL}/chats/{self.project_id}/stream",
+            headers=headers,
+            stream=True,
+            timeout=(5, CHAT_STREAM_TIMEOUT)
+        ) as response:
+            content_type = response.headers.get('content-type', '')
+            if response.status_code != 200 or not content_type.startswith('text/event-stream'):
+                return False
+            data_lines = []
+            try:
+                for line in response.iter_lines(decode_unicode=True):
+                    if self.stop_event.is_set():
+                        break
+                    if line.startswith("data:"):
+                        data_lines.append(line[5:].lstrip())
+                    elif line.startswith("id:"):
+                        self.last_event_id = line[3:].strip()
+                    elif not line and data_lines:
+                        event = json.loads("\n".join(data_lines))
+                        entries = event if isinstance(event, list) else [event]
+                        # Keep the poll offset in step with entries received here
+                        self.known_count += len(entries)
+                        self.push(entries)
+                        data_lines = []
+            except requests.ConnectionError:
+                # Idle or dropped stream; reconnect on the next loop
+                pass
+        return True
+
+    # Returns True when new entries arrived
+    def poll_history(self):
+        # Let the backend answer 304 instead of resending an unchanged history
+        headers = {"If-None-Match": self.etag} if self.etag else {}
+        try:
+            with self.http_session.get(
+                f"{BASE_URL}/chats/{self.project_id}",
+                headers=headers,
+                stream=True,
+                timeout=10
+            ) as response:
+                if response.status_code != 200:
+                    return False
+                self.etag = response.headers.get('etag')
+                history = stream_json_array(response)
+        except (requests.RequestException, ValueError):
+            return False
+        new_entries = history[self.known_count:]
+        self.known_count = len(history)
+        self.push(new_entries)
+        return bool(new_entries)
+
+    def push(self, entries):
+        if entries:
+            with self.lock:
+                self.pending.extend(entries)
+
+    def has_pending(self):
+        with self.lock:
+            return bool(self.pending)
+
+    def drain(self):
+        with self.lock:
+            entries, self.pending = self.pending, []
+        return entries
+
+    def stop(self):
+        self.stop_event.set()
+
+# Function to build a key identifying a chat entry
+def chat_entry_key(entry):
+    return (entry.get("timestamp"), entry.get("message"), entry.get("response"))
+
+# Function to append new chat entries, skipping ones already shown
+def merge_chat_entries(entries, new_entries):
+    seen = {chat_entry_key(entry) for entry in entries}
+    for entry in new_entries:
+        key = chat_entry_key(entry)
+        if key not in seen:
+            seen.add(key)
+            entries.append(entry)
+    return entries
+
+# Function to start (or reuse) the chat listener for a project
+def get_chat_listener(project_id, known_count=0, catch_up=False):
+    listener = st.session_state.chat_listeners.get(project_id)
+    if listener is None or not listener.is_alive():
+        listener = ChatListener(project_id, current_session_id(), get_api_session(), known_count, catch_up)
+        listener.start()
+        st.session_state.chat_listeners[project_id] = listener
+    return listener
+
+# Function to stop chat listeners for projects that are no longer open
+def stop_chat_listeners(keep_project_id=None):
+    for project_id, listener in list(st.session_state.chat_listeners.items()):
+        if project_id != keep_project_id:
+            listener.stop()
+            del st.session_state.chat_listeners[project_id]
+
+# Function to get the chat entries for a project, including pushed updates
+# Returns the entries and whether they are only the latest part of the history
+def sync_chat_entries(project_id):
+    entries = cache_get("chat_entries", project_id)
+    tail = st.session_state.chat_tail
+    fetched = False
+    if entries is not None:
+        is_full = True
+        total = len(entries)
+    elif tail and tail["project_id"] == project_id:
+        # The full history was too large to cache or was evicted; keep showing
+        # the tail and the listener's updates instead of refetching every refresh
+        is_full = False
+        entries = tail["entries"]
+        total = tail["total"]
+    else:
+        entries = get_chat_history(project_id)
+        # Errors are not cached, so the next rerun tries the API again
+        if entries is None:
+            return [], False
+        is_full = fetched = True
+        entries = cache_put("chat_entries", project_id, entries)
+        total = len(entries)
+
+    listener = get_chat_listener(project_id, total, catch_up=not fetched)
+    new_entries = listener.drain()
+    if new_entries:
+        count = len(entries)
+        merge_chat_entries(entries, new_entries)
+        total += len(entries) - count
+        if is_full:
+            # Store again so the cache re-measures the grown history
+            cache_put("chat_entries", project_id, entries)
+    if new_entries or fetched or not tail or tail["project_id"] != project_id:
+        remember_chat_tail(project_id, entries, total)
+    return entries, total > len(entries)
+
+# Function to keep the latest entries of the open project's history in session state
+def remember_chat_tail(project_id, entries, total):
+    st.session_state.chat_tail = {
+        "project_id": project_id,
+        "entries": entries[-CHAT_TAIL_ENTRIES:],
+        "total": total
+    }
 
 # Function to format timestamp
 def format_timestamp(timestamp_str):
@@ -213,6 +649,7 @@ def format_timestamp(timestamp_str):
 # Function to navigate to a page
 def navigate_to(page, project_id=None):
     st.session_state.current_page = page
+    stop_chat_listeners(project_id if page == "chat" else None)
     if project_id is not None:
         st.session_state.current_project_id = project_id
         # Only set as active project when creating a new project
@@ -228,250 +665,11 @@ def toggle_add_project():
 # Function to change the current tab
 def change_tab(tab):
     st.session_state.current_tab = tab
+    # Stop listening for chat updates while the chat is not shown
+    if tab != "chat":
+        stop_chat_listeners()
     st.rerun()
 
-# Create project risk visualizations
-def render_project_health_gauge(health_percentage):
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=health_percentage,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': "Project Health"},
-        number={'font': {'size': 40}, 'suffix': '%'},  # Improved number formatting
-        gauge={
-            'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
-            'bar': {'color': "darkblue"},
-            'bgcolor': "white",
-            'borderwidth': 2,
-            'bordercolor': "gray",
-            'steps': [
-                {'range': [0, 30], 'color': 'red'},
-                {'range': [30, 70], 'color': 'yellow'},
-                {'range': [70, 100], 'color': 'green'}],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': health_percentage}}))
-    
-    # Center the gauge correctly
-    fig.update_layout(
-        height=300,
-        margin=dict(l=20, r=20, t=50, b=20),
-        autosize=True
-    )
-    return fig
-
-def create_risk_breakdown_chart(risks):
-    risk_types = {}
-    for risk in risks:
-        factor = risk.get("factor", "Unknown")
-        if factor in risk_types:
-            risk_types[factor] += 1
-        else:
-            risk_types[factor] = 1
-    
-    fig = px.pie(
-        names=list(risk_types.keys()),
-        values=list(risk_types.values()),
-        title="Risk Breakdown by Type",
-        color_discrete_sequence=px.colors.sequential.Reds_r
-    )
-    fig.update_layout(height=400)
-    return fig
-
-def create_risk_heatmap(risks):
-    probabilities = []
-    impacts = []
-    descriptions = []
-    types = []
-    colors = []
-    
-    severity_impact = {
-        "Critical": 0.9, 
-        "High": 0.7, 
-        "Medium": 0.5, 
-        "Low": 0.3
-    }
-    
-    severity_color = {
-        "Critical": "red", 
-        "High": "orange", 
-        "Medium": "yellow", 
-        "Low": "green"
-    }
-    
-    for risk in risks:
-        severity = risk.get("severity", "Low")
-        factor = risk.get("factor", "Unknown")
-        description = risk.get("description", "No description")
-        
-        probability = risk.get("probability", 0.5)
-        impact = severity_impact.get(severity, 0.3)
-        
-        probabilities.append(probability)
-        impacts.append(impact)
-        descriptions.append(description)
-        types.append(factor)
-        colors.append(severity_color.get(severity, "green"))
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=probabilities,
-        y=impacts,
-        mode='markers',
-        marker=dict(
-            size=12,
-            color=colors,
-            line=dict(width=1, color='DarkSlateGrey')
-        ),
-        text=[f"{t}: {d}" for t, d in zip(types, descriptions)],
-        hoverinfo='text'
-    ))
-    
-    fig.update_layout(
-        title="Risk Evaluation Chart (Probability vs. Impact)",
-        xaxis_title="Probability",
-        yaxis_title="Impact",
-        xaxis=dict(range=[0, 1]),
-        yaxis=dict(range=[0, 1]),
-        height=400
-    )
-    
-    return fig
-
-def create_risk_trend_chart(risk_history):
-    dates = []
-    critical = []
-    high = []
-    medium = []
-    low = []
-    
-    for entry in risk_history:
-        dates.append(entry.get("date"))
-        counts = entry.get("counts", {})
-        critical.append(counts.get("Critical", 0))
-        high.append(counts.get("High", 0))
-        medium.append(counts.get("Medium", 0))
-        low.append(counts.get("Low", 0))
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=dates, y=critical,
-        mode='lines+markers',
-        name='Critical',
-        line=dict(color='red', width=2)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=dates, y=high,
-        mode='lines+markers',
-        name='High',
-        line=dict(color='orange', width=2)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=dates, y=medium,
-        mode='lines+markers',
-        name='Medium',
-        line=dict(color='yellow', width=2)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=dates, y=low,
-        mode='lines+markers',
-        name='Low',
-        line=dict(color='green', width=2)
-    ))
-    
-    fig.update_layout(
-        title="Risk Trend Over Time",
-        xaxis_title="Date",
-        yaxis_title="Number of Risks",
-        height=400
-    )
-    
-    return fig
-
-def create_timeline_chart(milestones):
-    names = []
-    start_dates = []
-    end_dates = []
-    colors = []
-    
-    for milestone in milestones:
-        names.append(milestone.get("name", "Unnamed"))
-        planned_date = milestone.get("planned_date")
-        actual_date = milestone.get("actual_date")
-        status = milestone.get("status", "unknown")
-        
-        start_dates.append(planned_date)
-        end_dates.append(actual_date if actual_date else planned_date)
-        
-        if status == "completed":
-            colors.append("green")
-        elif status == "in_progress":
-            colors.append("blue")
-        else:
-            colors.append("gray")
-    
-    fig = px.timeline(
-        x_start=start_dates,
-        x_end=end_dates,
-        y=names,
-        color=colors,
-        labels={"x_start": "Planned Date", "x_end": "Actual/Expected Date", "color": "Status"}
-    )
-    
-    fig.update_layout(
-        title="Project Milestones",
-        xaxis_title="Date",
-        height=400
-    )
-    
-    return fig
-
-# Sample data for visualizations
-def get_sample_data():
-    # Sample risk data
-    identified_risks = [
-        {"severity": "Critical", "factor": "Schedule", "description": "Project timeline slipping due to resource constraints", "probability": 0.8},
-        {"severity": "High", "factor": "Budget", "description": "Increased vendor costs exceeding planned budget", "probability": 0.6},
-        {"severity": "Medium", "factor": "Resources", "description": "Key team member availability reduced", "probability": 0.4},
-        {"severity": "High", "factor": "Technical", "description": "Integration issues with legacy systems", "probability": 0.7},
-        {"severity": "Medium", "factor": "Market", "description": "Competitor launched similar product", "probability": 0.5},
-        {"severity": "Critical", "factor": "Schedule", "description": "Delayed approvals from stakeholders", "probability": 0.9},
-        {"severity": "Low", "factor": "Resources", "description": "Minor skill gaps in development team", "probability": 0.3}
-    ]
-    
-    # Sample risk history data
-    risk_history = [
-        {"date": "2025-01-15", "counts": {"Critical": 3, "High": 5, "Medium": 8, "Low": 4}},
-        {"date": "2025-02-01", "counts": {"Critical": 2, "High": 6, "Medium": 7, "Low": 5}},
-        {"date": "2025-02-15", "counts": {"Critical": 3, "High": 4, "Medium": 6, "Low": 6}},
-        {"date": "2025-03-01", "counts": {"Critical": 4, "High": 3, "Medium": 5, "Low": 7}},
-        {"date": "2025-03-15", "counts": {"Critical": 2, "High": 4, "Medium": 4, "Low": 8}},
-        {"date": "2025-04-01", "counts": {"Critical": 1, "High": 3, "Medium": 5, "Low": 7}}
-    ]
-    
-    # Sample milestone data
-    milestones = [
-        {"name": "Project Kickoff", "planned_date": "2025-01-01", "actual_date": "2025-01-01", "status": "completed"},
-        {"name": "Requirements Gathering", "planned_date": "2025-01-15", "actual_date": "2025-01-20", "status": "completed"},
-        {"name": "Design Phase", "planned_date": "2025-02-01", "actual_date": "2025-02-10", "status": "completed"},
-        {"name": "Development Phase", "planned_date": "2025-02-15", "actual_date": None, "status": "in_progress"},
-        {"name": "Testing Phase", "planned_date": "2025-03-15", "actual_date": None, "status": "not_started"},
-        {"name": "Deployment", "planned_date": "2025-04-15", "actual_date": None, "status": "not_started"}
-    ]
-    
-    return {
-        "health_percentage": 65,
-        "identified_risks": identified_risks,
-        "risk_history": risk_history,
-        "milestones": milestones
-    }
-
 # Layout for the landing page
 def render_landing_page():
     st.image("AGENTVERSE.png", use_container_width=True)
@@ -483,8 +681,11 @@ def render_landing_page():
     </div>
     """, unsafe_allow_html=True)
     
-    col1, col2 = st.columns([4, 1])
+    col1, col2, col3 = st.columns([3, 1, 1])
     with col2:
+        if st.button("📊 Portfolio"):
+            navigate_to("portfolio")
+    with col3:
         if st.button("➕ Add Project"):
             toggle_add_project()
     
@@ -534,7 +735,7 @@ def render_landing_page():
     # Projects table
     st.subheader("Your Projects")
     
-    projects = get_projects()
+    projects = get_cached_projects()
     
     if not projects:
         st.info("No projects found. Create a new project to get started.")
@@ -560,7 +761,7 @@ def render_chat_page():
     project_id = st.session_state.current_project_id
 
     # Get all projects to display the current project name
-    projects = get_projects()
+    projects = get_cached_projects()
     current_project = next((p for p in projects if p.get('project_id') == project_id), None)
     project_name = current_project.get('name', f"Project {project_id}") if current_project else f"Project {project_id}"
 
@@ -572,10 +773,20 @@ def render_chat_page():
     with col2:
         st.header(f"{project_name}")
 
-    # Tabs
-    tab1, tab2 = st.tabs(["Chat", "Visualization"])
+    # Tabs. Only the selected tab is rendered, so the chat listener and its
+    # refreshing fragment run only while the chat is shown.
+    tabs = {"Chat": "chat", "Visualization": "visualization"}
+    selected_tab = st.radio(
+        "View",
+        list(tabs),
+        index=list(tabs.values()).index(st.session_state.current_tab),
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    if tabs[selected_tab] != st.session_state.current_tab:
+        change_tab(tabs[selected_tab])
 
-    with tab1:
+    if st.session_state.current_tab == "chat":
         # Check if this is an active project (created in current session)
         is_active_project = st.session_state.active_project_id == project_id
         
@@ -583,8 +794,7 @@ def render_chat_page():
             render_active_chat(project_id)
         else:
             render_chat_history(project_id)
-    
-    with tab2:
+    else:
         render_visualizations()
 
 # Function to render chat history (read-only, no input box)
@@ -592,42 +802,36 @@ def render_chat_history(project_id):
     st.subheader("Project Risk Analysis History")
     st.info("Viewing chat history only. Create a new project to start a conversation.")
     
-    chat_history = get_chat_history(project_id)
-
-    if not chat_history:
-        st.info("No chat history found for this project.")
-    else:
-        for entry in chat_history:
-            # User message
-            message = entry.get("message")
-            if message:
-                st.markdown(f"""
-                <div class="user-message">
-                    <p>{message}</p>
-                    <div class="timestamp">{format_timestamp(entry.get("timestamp"))}</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-            # Assistant response
-            response = entry.get("response")
-            if response:
-                st.markdown(f"""
-                <div class="assistant-message">
-                    <p>{response}</p>
-                    <div class="timestamp">{format_timestamp(entry.get("timestamp"))}</div>
-                </div>
-                """, unsafe_allow_html=True)
+    render_chat_messages(project_id, "No chat history found for this project.")
 
 # Function to render active chat with input box
 def render_active_chat(project_id):
     st.subheader("Project Risk Analysis")
     
-    # Chat history
-    chat_history = get_chat_history(project_id)
+    render_chat_messages(
+        project_id,
+        "No messages yet. Start a conversation below.",
+        allow_input=True
+    )
+
+# Function to check for pushed chat entries. Only this small fragment runs on
+# the timer; the messages are re-rendered only when new entries have arrived.
+@st.fragment(run_every=CHAT_REFRESH_INTERVAL)
+def watch_chat_updates(project_id):
+    listener = st.session_state.chat_listeners.get(project_id)
+    if listener is not None and listener.has_pending():
+        # Projects, history and figures are cached, so a full rerun is cheap
+        st.rerun()
+
+# Function to render the chat area
+def render_chat_messages(project_id, empty_text, allow_input=False):
+    chat_history, truncated = sync_chat_entries(project_id)
 
     if not chat_history:
-        st.info("No messages yet. Start a conversation below.")
+        st.info(empty_text)
     else:
+        if truncated:
+            st.caption(f"Showing the latest {len(chat_history)} messages of this conversation.")
         for entry in chat_history:
             # User message
             message = entry.get("message")
@@ -648,8 +852,14 @@ def render_active_chat(project_id):
                     <div class="timestamp">{format_timestamp(entry.get("timestamp"))}</div>
                 </div>
                 """, unsafe_allow_html=True)
-    
-    # Input for new messages
+
+    watch_chat_updates(project_id)
+
+    if allow_input:
+        render_chat_input(project_id)
+
+# Function to render the input box for new messages
+def render_chat_input(project_id):
     st.markdown("---")
     
     # Initialize the clear chat input flag if not already set
@@ -673,10 +883,26 @@ def render_active_chat(project_id):
         if submitted and user_message:
             response = continue_chat(project_id, user_message)
             if response:
+                # Pull in the new entry right away instead of waiting for the listener
+                entries = get_chat_history(project_id)
+                if entries is not None:
+                    cache_put("chat_entries", project_id, entries)
+                    remember_chat_tail(project_id, entries, len(entries))
+                    listener = st.session_state.chat_listeners.get(project_id)
+                    if listener is not None:
+                        listener.known_count = len(entries)
                 # Set the flag to clear the input on next render
                 st.session_state.clear_chat_input = True
                 st.rerun()
 
+# Function to build a chart once per project and reuse it for this session
+def get_cached_figure(name, builder, data):
+    key = (st.session_state.current_project_id, name)
+    fig = cache_get("figures", key)
+    if fig is None:
+        fig = cache_put("figures", key, builder(data))
+    return fig
+
 # Function to render visualizations tab
 def render_visualizations():
     st.subheader("Risk Visualizations")
@@ -688,7 +914,7 @@ def render_visualizations():
     col1, col2 = st.columns([1, 2])
     with col1:
         st.markdown("### Project Health Score")
-        health_gauge = render_project_health_gauge(sample_data["health_percentage"])
+        health_gauge = get_cached_figure("health_gauge", render_project_health_gauge, sample_data["health_percentage"])
         st.plotly_chart(health_gauge, use_container_width=True)
     
     with col2:
@@ -709,22 +935,22 @@ def render_visualizations():
     
     with col1:
         st.markdown("### Risk Breakdown")
-        risk_breakdown = create_risk_breakdown_chart(sample_data["identified_risks"])
+        risk_breakdown = get_cached_figure("risk_breakdown", create_risk_breakdown_chart, sample_data["identified_risks"])
         st.plotly_chart(risk_breakdown, use_container_width=True)
     
     with col2:
         st.markdown("### Risk Evaluation Chart")
-        risk_heatmap = create_risk_heatmap(sample_data["identified_risks"])
+        risk_heatmap = get_cached_figure("risk_heatmap", create_risk_heatmap, sample_data["identified_risks"])
         st.plotly_chart(risk_heatmap, use_container_width=True)
     
     # Risk trend chart
     st.markdown("### Risk Trend Over Time")
-    risk_trend = create_risk_trend_chart(sample_data["risk_history"])
+    risk_trend = get_cached_figure("risk_trend", create_risk_trend_chart, sample_data["risk_history"])
     st.plotly_chart(risk_trend, use_container_width=True)
     
     # Project timeline
     st.markdown("### Project Timeline")
-    timeline_chart = create_timeline_chart(sample_data["milestones"])
+    timeline_chart = get_cached_figure("timeline", create_timeline_chart, sample_data["milestones"])
     st.plotly_chart(timeline_chart, use_container_width=True)
     
     # Risk table
@@ -746,6 +972,199 @@ def render_visualizations():
         """)
         st.markdown("---")
 
+# Function to fetch risk data for many projects concurrently
+def fetch_portfolio_risk_data(projects):
+    risk_data = {}
+    with ThreadPoolExecutor(max_workers=PORTFOLIO_FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(get_project_risk_data, project.get('project_id')): project
+            for project in projects
+        }
+        for future in as_completed(futures):
+            project = futures[future]
+            try:
+                risk_data[project.get('project_id')] = future.result()
+            except Exception as e:
+                st.warning(f"Could not load risk data for {project.get('name')}: {e}")
+    return risk_data
+
+# Function to aggregate health, severity counts and risk factors for a set of projects
+def summarize_portfolio(names, risk_data):
+    risks = pd.DataFrame(
+        [
+            dict(risk, project_id=project_id)
+            for project_id, data in risk_data.items()
+            for risk in data.get("identified_risks", [])
+        ],
+        columns=["project_id", "severity", "factor", "probability"]
+    )
+    # Use the same defaults as the per-project charts, which treat missing or
+    # unrecognised severities as Low, a missing factor as Unknown and a
+    # missing probability as 0.5
+    risks = risks.fillna({"severity": "Low", "factor": "Unknown", "probability": 0.5})
+    risks.loc[~risks["severity"].isin(SEVERITY_LEVELS), "severity"] = "Low"
+
+    summary = pd.DataFrame({
+        "project_id": list(risk_data),
+        "name": [names.get(project_id, f"Project {project_id}") for project_id in risk_data],
+        "health": [data.get("health_percentage", 0) for data in risk_data.values()],
+    }).set_index("project_id")
+
+    severity_counts = (
+        risks.groupby(["project_id", "severity"]).size().unstack(fill_value=0)
+        if not risks.empty else pd.DataFrame(index=summary.index)
+    ).reindex(index=summary.index, columns=SEVERITY_LEVELS, fill_value=0)
+    summary = summary.join(severity_counts)
+    summary["total_risks"] = summary[SEVERITY_LEVELS].sum(axis=1)
+    summary["avg_probability"] = risks.groupby("project_id")["probability"].mean().reindex(summary.index)
+
+    factors = risks.groupby(["project_id", "factor"]).size().rename("count").reset_index()
+    return summary, factors
+
+# Function to get the portfolio summary, recomputing only projects whose data changed
+def get_portfolio_summary(projects):
+    names = {project.get('project_id'): project.get('name') for project in projects}
+
+    cached = cache_get("portfolio", "summary")
+    previous = cached["fingerprints"] if cached else {}
+    previous_fetched_at = cached["fetched_at"] if cached else {}
+
+    # Only refetch projects whose risk data is older than the TTL
+    now = time.time()
+    stale = [
+        project for project in projects
+        if now - previous_fetched_at.get(project.get('project_id'), 0) >= RISK_DATA_CACHE_TTL
+    ]
+    risk_data = fetch_portfolio_risk_data(stale)
+
+    fingerprints = {}
+    fetched_at = {}
+    for project_id in names:
+        if project_id in risk_data:
+            fingerprints[project_id] = risk_data_fingerprint(
+                {"name": names[project_id], "data": risk_data[project_id]}
+            )
+            fetched_at[project_id] = now
+        elif project_id in previous:
+            # Fresh, or its refetch failed: keep the last summary and retry later
+            fingerprints[project_id] = previous[project_id]
+            fetched_at[project_id] = previous_fetched_at[project_id]
+
+    changed = [project_id for project_id, fp in fingerprints.items() if previous.get(project_id) != fp]
+    unchanged = [project_id for project_id in fingerprints if project_id not in changed]
+
+    if cached and not changed and len(unchanged) == len(previous):
+        cached["fetched_at"] = fetched_at
+        return cached["summary"], cached["factors"]
+
+    summaries = []
+    factor_frames = []
+    if cached:
+        summaries.append(cached["summary"].loc[unchanged])
+        factor_frames.append(cached["factors"][cached["factors"]["project_id"].isin(unchanged)])
+    if changed:
+        summary, factors = summarize_portfolio(names, {project_id: risk_data[project_id] for project_id in changed})
+        summaries.append(summary)
+        factor_frames.append(factors)
+    if not summaries:
+        return pd.DataFrame(), pd.DataFrame(columns=["project_id", "factor", "count"])
+
+    summary = pd.concat(summaries)
+    factors = pd.concat(factor_frames, ignore_index=True)
+    cache_put("portfolio", "summary", {
+        "fingerprints": fingerprints,
+        "fetched_at": fetched_at,
+        "summary": summary,
+        "factors": factors
+    })
+    return summary, factors
+
+# Layout for the portfolio page
+def render_portfolio_page():
+    col1, col2 = st.columns([1, 5])
+    with col1:
+        if st.button("← Back to Projects"):
+            navigate_to("landing")
+    with col2:
+        st.header("Portfolio Risk Overview")
+
+    projects = get_cached_projects()
+    if not projects:
+        st.info("No projects found. Create a new project to get started.")
+        return
+
+    summary, factors = get_portfolio_summary(projects)
+    if summary.empty:
+        st.info("No risk data available for your projects.")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Projects", len(summary))
+    with col2:
+        st.metric("Average Health", f"{summary['health'].mean():.0f}%")
+    with col3:
+        st.metric("Critical Risks", int(summary["Critical"].sum()))
+    with col4:
+        st.metric("At-Risk Projects", int((summary["health"] < 30).sum()))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(create_portfolio_health_chart(summary), use_container_width=True)
+    with col2:
+        st.plotly_chart(create_portfolio_severity_chart(summary), use_container_width=True)
+
+    st.plotly_chart(create_portfolio_factor_chart(factors), use_container_width=True)
+
+    st.markdown("### Projects by Health")
+    st.dataframe(summary.sort_values("health"), use_container_width=True)
+
+# Function to format a byte count for display
+def format_bytes(size):
+    for unit in ["B", "KB", "MB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+# Function to check the admin token against the one configured in st.secrets
+def is_admin_token(token):
+    try:
+        admin_token = st.secrets.get("admin_token")
+    except FileNotFoundError:
+        admin_token = None
+    # Without a configured token the admin page stays disabled
+    return bool(admin_token) and hmac.compare_digest(str(token), str(admin_token))
+
+# Function to turn a session id into a label that cannot be used to join the session
+def session_label(session_id):
+    return hashlib.sha256(session_id.encode("utf-8")).hexdigest()[:12]
+
+# Layout for the admin page showing cache memory usage
+def render_admin_page():
+    st.header("Cache Memory Usage")
+
+    cache = get_session_cache()
+    total_bytes, sessions = cache.usage()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Cached", format_bytes(total_bytes))
+    with col2:
+        st.metric("Global Budget", format_bytes(cache.global_budget))
+    with col3:
+        st.metric("Sessions", len(sessions))
+    st.progress(min(total_bytes / cache.global_budget, 1.0))
+
+    st.markdown(f"Per-session budget: {format_bytes(cache.session_budget)}")
+    if not sessions:
+        st.info("No cached data.")
+    else:
+        usage_df = pd.DataFrame(sessions).fillna(0).sort_values("bytes", ascending=False)
+        usage_df["session_id"] = usage_df["session_id"].map(session_label)
+        usage_df = usage_df.rename(columns={"session_id": "session"})
+        st.dataframe(usage_df, use_container_width=True)
+
 # Main app logic
 def main():
     # Add ping route support to keep app alive
@@ -753,10 +1172,22 @@ def main():
         st.write("✅ Ping received. App is alive.")
         return
 
+    # Release cached data held for sessions that have disconnected
+    get_session_cache().cleanup()
+
+    if "admin" in st.query_params:
+        if is_admin_token(st.query_params["admin"]):
+            render_admin_page()
+        else:
+            st.error("Not authorized to view the admin page.")
+        return
+
     if st.session_state.current_page == "landing":
         render_landing_page()
     elif st.session_state.current_page == "chat":
         render_chat_page()
+    elif st.session_state.current_page == "portfolio":
+        render_portfolio_page()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
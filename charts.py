@@ -0,0 +1,262 @@
+import plotly.express as px
+import plotly.graph_objects as go
+
+SEVERITY_LEVELS = ["Critical", "High", "Medium", "Low"]
+
+# Create project risk visualizations
+def render_project_health_gauge(health_percentage):
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=health_percentage,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Project Health"},
+        number={'font': {'size': 40}, 'suffix': '%'},  # Improved number formatting
+        gauge={
+            'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
+            'bar': {'color': "darkblue"},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "gray",
+            'steps': [
+                {'range': [0, 30], 'color': 'red'},
+                {'range': [30, 70], 'color': 'yellow'},
+                {'range': [70, 100], 'color': 'green'}],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': health_percentage}}))
+    
+    # Center the gauge correctly
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=50, b=20),
+        autosize=True
+    )
+    return fig
+
+def create_risk_breakdown_chart(risks):
+    risk_types = {}
+    for risk in risks:
+        factor = risk.get("factor", "Unknown")
+        if factor in risk_types:
+            risk_types[factor] += 1
+        else:
+            risk_types[factor] = 1
+    
+    fig = px.pie(
+        names=list(risk_types.keys()),
+        values=list(risk_types.values()),
+        title="Risk Breakdown by Type",
+        color_discrete_sequence=px.colors.sequential.Reds_r
+    )
+    fig.update_layout(height=400)
+    return fig
+
+def create_risk_heatmap(risks):
+    probabilities = []
+    impacts = []
+    descriptions = []
+    types = []
+    colors = []
+    
+    severity_impact = {
+        "Critical": 0.9, 
+        "High": 0.7, 
+        "Medium": 0.5, 
+        "Low": 0.3
+    }
+    
+    severity_color = {
+        "Critical": "red", 
+        "High": "orange", 
+        "Medium": "yellow", 
+        "Low": "green"
+    }
+    
+    for risk in risks:
+        severity = risk.get("severity", "Low")
+        factor = risk.get("factor", "Unknown")
+        description = risk.get("description", "No description")
+        
+        probability = risk.get("probability", 0.5)
+        impact = severity_impact.get(severity, 0.3)
+        
+        probabilities.append(probability)
+        impacts.append(impact)
+        descriptions.append(description)
+        types.append(factor)
+        colors.append(severity_color.get(severity, "green"))
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=probabilities,
+        y=impacts,
+        mode='markers',
+        marker=dict(
+            size=12,
+            color=colors,
+            line=dict(width=1, color='DarkSlateGrey')
+        ),
+        text=[f"{t}: {d}" for t, d in zip(types, descriptions)],
+        hoverinfo='text'
+    ))
+    
+    fig.update_layout(
+        title="Risk Evaluation Chart (Probability vs. Impact)",
+        xaxis_title="Probability",
+        yaxis_title="Impact",
+        xaxis=dict(range=[0, 1]),
+        yaxis=dict(range=[0, 1]),
+        height=400
+    )
+    
+    return fig
+
+def create_risk_trend_chart(risk_history):
+    dates = []
+    critical = []
+    high = []
+    medium = []
+    low = []
+    
+    for entry in risk_history:
+        dates.append(entry.get("date"))
+        counts = entry.get("counts", {})
+        critical.append(counts.get("Critical", 0))
+        high.append(counts.get("High", 0))
+        medium.append(counts.get("Medium", 0))
+        low.append(counts.get("Low", 0))
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=dates, y=critical,
+        mode='lines+markers',
+        name='Critical',
+        line=dict(color='red', width=2)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=dates, y=high,
+        mode='lines+markers',
+        name='High',
+        line=dict(color='orange', width=2)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=dates, y=medium,
+        mode='lines+markers',
+        name='Medium',
+        line=dict(color='yellow', width=2)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=dates, y=low,
+        mode='lines+markers',
+        name='Low',
+        line=dict(color='green', width=2)
+    ))
+    
+    fig.update_layout(
+        title="Risk Trend Over Time",
+        xaxis_title="Date",
+        yaxis_title="Number of Risks",
+        height=400
+    )
+    
+    return fig
+
+def create_timeline_chart(milestones):
+    names = []
+    start_dates = []
+    end_dates = []
+    colors = []
+    
+    for milestone in milestones:
+        names.append(milestone.get("name", "Unnamed"))
+        planned_date = milestone.get("planned_date")
+        actual_date = milestone.get("actual_date")
+        status = milestone.get("status", "unknown")
+        
+        start_dates.append(planned_date)
+        end_dates.append(actual_date if actual_date else planned_date)
+        
+        if status == "completed":
+            colors.append("green")
+        elif status == "in_progress":
+            colors.append("blue")
+        else:
+            colors.append("gray")
+    
+    fig = px.timeline(
+        x_start=start_dates,
+        x_end=end_dates,
+        y=names,
+        color=colors,
+        labels={"x_start": "Planned Date", "x_end": "Actual/Expected Date", "color": "Status"}
+    )
+    
+    fig.update_layout(
+        title="Project Milestones",
+        xaxis_title="Date",
+        height=400
+    )
+    
+    return fig
+
+def create_portfolio_health_chart(summary):
+    fig = px.bar(
+        summary.sort_values("health"),
+        x="health",
+        y="name",
+        orientation="h",
+        color="health",
+        color_continuous_scale=["red", "yellow", "green"],
+        range_color=[0, 100],
+        labels={"health": "Health (%)", "name": "Project"},
+        title="Project Health Across Portfolio"
+    )
+    fig.update_layout(height=max(400, 25 * len(summary)))
+    return fig
+
+def create_portfolio_severity_chart(summary):
+    severity_color = {
+        "Critical": "red",
+        "High": "orange",
+        "Medium": "yellow",
+        "Low": "green"
+    }
+
+    fig = go.Figure()
+
+    for severity in SEVERITY_LEVELS:
+        fig.add_trace(go.Bar(
+            x=summary["name"],
+            y=summary[severity],
+            name=severity,
+            marker_color=severity_color[severity]
+        ))
+
+    fig.update_layout(
+        title="Risks by Severity per Project",
+        xaxis_title="Project",
+        yaxis_title="Number of Risks",
+        barmode="stack",
+        height=400
+    )
+
+    return fig
+
+def create_portfolio_factor_chart(factors):
+    totals = factors.groupby("factor")["count"].sum().sort_values(ascending=False)
+
+    fig = px.bar(
+        x=totals.index,
+        y=totals.values,
+        labels={"x": "Risk Factor", "y": "Number of Risks"},
+        title="Risk Factors Across Portfolio",
+        color_discrete_sequence=px.colors.sequential.Reds_r
+    )
+    fig.update_layout(height=400)
+    return fig
@@ -0,0 +1,189 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from html import escape
+
+import pandas as pd
+import requests
+
+from charts import (
+    render_project_health_gauge,
+    create_risk_breakdown_chart,
+    create_risk_heatmap,
+    create_risk_trend_chart,
+    create_timeline_chart,
+)
+from risk_data import get_project_risk_data, risk_data_fingerprint
+
+# Define the base URL for the API
+BASE_URL = os.environ.get("AGENTVERSE_API_URL", "https://agentverse-uz89.onrender.com")
+
+# Records which data each project's exported report was built from
+MANIFEST_FILE = "manifest.json"
+
+# Charts exported for each project, in the order they appear in the HTML report
+CHART_NAMES = ["health_gauge", "risk_breakdown", "risk_heatmap", "risk_trend", "timeline"]
+
+
+# Function to fetch all projects
+def fetch_projects(base_url):
+    response = requests.get(f"{base_url}/projects/", timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+# Function to fingerprint the inputs of a report so unchanged projects are skipped
+def report_fingerprint(project, data, formats, plotlyjs=True):
+    return risk_data_fingerprint(
+        {"name": project.get("name"), "data": data, "formats": sorted(formats), "plotlyjs": plotlyjs}
+    )
+
+# Function to build the same charts shown on the Visualization tab
+def build_dashboard_figures(data):
+    return {
+        "health_gauge": render_project_health_gauge(data["health_percentage"]),
+        "risk_breakdown": create_risk_breakdown_chart(data["identified_risks"]),
+        "risk_heatmap": create_risk_heatmap(data["identified_risks"]),
+        "risk_trend": create_risk_trend_chart(data["risk_history"]),
+        "timeline": create_timeline_chart(data["milestones"]),
+    }
+
+# Function to write a project's dashboard as a single static HTML page
+def write_html_report(path, project, data, figures, plotlyjs=True):
+    name = escape(str(project.get("name", project.get("project_id"))))
+    parts = [
+        "<!DOCTYPE html>",
+        "<html><head><meta charset='utf-8'>",
+        f"<title>{name} - Risk Report</title></head><body>",
+        f"<h1>{name}</h1>",
+        f"<p>Project ID: {escape(str(project.get('project_id')))}</p>",
+    ]
+    for index, fig in enumerate(figures.values()):
+        # Include plotly.js once for the whole page; embedded by default so reports work offline
+        parts.append(fig.to_html(full_html=False, include_plotlyjs=plotlyjs if index == 0 else False))
+
+    parts.append("<h2>Identified Risks</h2>")
+    parts.append(pd.DataFrame(data["identified_risks"]).to_html(index=False))
+
+    parts.append("<h2>Critical Risks</h2><ul>")
+    for risk in data["identified_risks"]:
+        if risk.get("severity") == "Critical":
+            factor = escape(str(risk.get("factor", "Unknown")))
+            description = escape(str(risk.get("description", "No description")))
+            parts.append(f"<li><b>{factor}</b>: {description}</li>")
+    parts.append("</ul></body></html>")
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+
+# Function to list the files a project's export writes
+def report_paths(output_dir, project_id, formats):
+    project_dir = os.path.join(output_dir, str(project_id))
+    paths = []
+    if "html" in formats:
+        paths.append(os.path.join(project_dir, "report.html"))
+    if "png" in formats:
+        paths.extend(os.path.join(project_dir, f"{chart_name}.png") for chart_name in CHART_NAMES)
+    return paths
+
+# Function to export one project's report; runs in a worker process
+def export_project(project, data, formats, output_dir, plotlyjs=True):
+    project_dir = os.path.join(output_dir, str(project.get("project_id")))
+    os.makedirs(project_dir, exist_ok=True)
+
+    figures = build_dashboard_figures(data)
+    if "html" in formats:
+        write_html_report(os.path.join(project_dir, "report.html"), project, data, figures, plotlyjs)
+    if "png" in formats:
+        # Static image export needs the optional kaleido package
+        for chart_name in CHART_NAMES:
+            figures[chart_name].write_image(os.path.join(project_dir, f"{chart_name}.png"))
+    return project.get("project_id")
+
+# Function to load the manifest of previously exported reports
+def load_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# Function to save the manifest of exported reports
+def save_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    # Write to a temporary file first so an interruption never leaves a partial manifest
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+# Function to export reports for every project in parallel
+def export_reports(output_dir, formats, workers=None, force=False, base_url=BASE_URL, plotlyjs=True):
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+
+    jobs = []
+    for project in fetch_projects(base_url):
+        project_id = str(project.get("project_id"))
+        data = get_project_risk_data(project_id)
+        fingerprint = report_fingerprint(project, data, formats, plotlyjs)
+        outputs_exist = all(os.path.exists(path) for path in report_paths(output_dir, project_id, formats))
+        if not force and manifest.get(project_id) == fingerprint and outputs_exist:
+            print(f"Skipping {project_id}: unchanged")
+            continue
+        jobs.append((project, data, fingerprint))
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(export_project, project, data, formats, output_dir, plotlyjs): (project, fingerprint)
+            for project, data, fingerprint in jobs
+        }
+        for future in as_completed(futures):
+            project, fingerprint = futures[future]
+            project_id = str(project.get("project_id"))
+            try:
+                future.result()
+            except Exception as e:
+                failures += 1
+                print(f"Error exporting {project_id}: {e}", file=sys.stderr)
+                continue
+            manifest[project_id] = fingerprint
+            # Saved after every project so an interrupted run keeps its progress
+            save_manifest(output_dir, manifest)
+            print(f"Exported {project_id}")
+
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Export AgentVerse risk dashboards for all projects.")
+    parser.add_argument("--output-dir", default="reports", help="Directory to write reports to")
+    parser.add_argument(
+        "--format",
+        dest="formats",
+        action="append",
+        choices=["html", "png"],
+        help="Output format; repeat for several (default: html)"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--force", action="store_true", help="Re-export projects even if unchanged")
+    parser.add_argument("--base-url", default=BASE_URL, help="AgentVerse API base URL")
+    parser.add_argument(
+        "--plotlyjs-cdn",
+        action="store_true",
+        help="Load plotly.js from the CDN instead of embedding it (smaller, but needs internet to view)"
+    )
+    args = parser.parse_args()
+
+    failures = export_reports(
+        args.output_dir,
+        args.formats or ["html"],
+        workers=args.workers,
+        force=args.force,
+        base_url=args.base_url,
+        plotlyjs="cdn" if args.plotlyjs_cdn else True
+    )
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import hashlib
+import json
+
+# Sample data for visualizations
+def get_sample_data():
+    # Sample risk data
+    identified_risks = [
+        {"severity": "Critical", "factor": "Schedule", "description": "Project timeline slipping due to resource constraints", "probability": 0.8},
+        {"severity": "High", "factor": "Budget", "description": "Increased vendor costs exceeding planned budget", "probability": 0.6},
+        {"severity": "Medium", "factor": "Resources", "description": "Key team member availability reduced", "probability": 0.4},
+        {"severity": "High", "factor": "Technical", "description": "Integration issues with legacy systems", "probability": 0.7},
+        {"severity": "Medium", "factor": "Market", "description": "Competitor launched similar product", "probability": 0.5},
+        {"severity": "Critical", "factor": "Schedule", "description": "Delayed approvals from stakeholders", "probability": 0.9},
+        {"severity": "Low", "factor": "Resources", "description": "Minor skill gaps in development team", "probability": 0.3}
+    ]
+    
+    # Sample risk history data
+    risk_history = [
+        {"date": "2025-01-15", "counts": {"Critical": 3, "High": 5, "Medium": 8, "Low": 4}},
+        {"date": "2025-02-01", "counts": {"Critical": 2, "High": 6, "Medium": 7, "Low": 5}},
+        {"date": "2025-02-15", "counts": {"Critical": 3, "High": 4, "Medium": 6, "Low": 6}},
+        {"date": "2025-03-01", "counts": {"Critical": 4, "High": 3, "Medium": 5, "Low": 7}},
+        {"date": "2025-03-15", "counts": {"Critical": 2, "High": 4, "Medium": 4, "Low": 8}},
+        {"date": "2025-04-01", "counts": {"Critical": 1, "High": 3, "Medium": 5, "Low": 7}}
+    ]
+    
+    # Sample milestone data
+    milestones = [
+        {"name": "Project Kickoff", "planned_date": "2025-01-01", "actual_date": "2025-01-01", "status": "completed"},
+        {"name": "Requirements Gathering", "planned_date": "2025-01-15", "actual_date": "2025-01-20", "status": "completed"},
+        {"name": "Design Phase", "planned_date": "2025-02-01", "actual_date": "2025-02-10", "status": "completed"},
+        {"name": "Development Phase", "planned_date": "2025-02-15", "actual_date": None, "status": "in_progress"},
+        {"name": "Testing Phase", "planned_date": "2025-03-15", "actual_date": None, "status": "not_started"},
+        {"name": "Deployment", "planned_date": "2025-04-15", "actual_date": None, "status": "not_started"}
+    ]
+    
+    return {
+        "health_percentage": 65,
+        "identified_risks": identified_risks,
+        "risk_history": risk_history,
+        "milestones": milestones
+    }
+
+# Function to get the data behind a project's dashboard.
+# The backend has no risk endpoint yet, so every project uses the sample data.
+def get_project_risk_data(project_id):
+    return get_sample_data()
+
+# Function to fingerprint a project's risk data so unchanged projects can be skipped
+def risk_data_fingerprint(data):
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()